@@ -1,18 +1,82 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import json
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 import yaml
 import logging
+import collections
+from array import array
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from typing import Dict, List, Optional
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+from typing import Dict, Iterator, List
 import sys
 import os
-
+import functools
+import itertools
+
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# orjson is optional; when installed it parses large webhook files several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional; when installed, large webhook files are parsed one group at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Webhook files larger than this (in bytes) are streamed with ijson when it is available
+WEBHOOK_STREAM_THRESHOLD = 1024 * 1024
+
+# (connect, read) timeout in seconds for webhook requests, so a stalled connection can't hang a worker
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Stack size for webhook worker threads (bytes); the OS default is typically 1-8 MB each
+WORKER_STACK_SIZE = 512 * 1024
+
+# Sentinel for "no item found", distinct from any value a JSON file can contain
+_MISSING = object()
+
+def load_json(file):
+    """Parse JSON from a file opened in binary mode, using orjson when it is available."""
+    data = file.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def dump_json(data, file):
+    """Write data as indented JSON to a file opened in binary mode, using orjson when it is available."""
+    if orjson is not None:
+        file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        file.write(json.dumps(data, indent=2).encode('utf-8'))
+
+def write_file_atomic(path, write, mode='w'):
+    """Write a file through a temporary sibling and os.replace, so a failed write never truncates it."""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, mode) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+# Base directory for bundled resources: the PyInstaller extraction dir when frozen, else this file's dir
+_BASE_PATH = getattr(sys, '_MEIPASS', os.path.abspath(os.path.dirname(__file__)))
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
-    base_path = getattr(sys, '_MEIPASS', os.path.abspath(os.path.dirname(__file__)))
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 # Set up logging to provide clear, timestamped output in the application
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -33,6 +97,76 @@ class OblivionGUI:
         'total_pings': 450000  # Default total pings for a shard in Switch mode
     }
 
+    # Settings fields: (label, variable name, type, config key)
+    # Essentials are always shown in the Settings tab; advanced fields sit behind a toggle
+    _ESSENTIAL_SPEC = (
+        ("Message:", 'message_var', tk.StringVar, 'message'),
+        ("Username:", 'username_var', tk.StringVar, 'username'),
+        ("Avatar URL:", 'avatar_var', tk.StringVar, 'avatar_url'),
+        ("Delay (seconds):", 'delay_var', tk.DoubleVar, 'delay'),
+        ("Total Pings per Shard (Sequential Mode):", 'total_pings_var', tk.IntVar, 'total_pings'),
+    )
+    _ADVANCED_SPEC = (
+        ("Rate Limit Backoff (seconds):", 'backoff_var', tk.DoubleVar, 'rate_limit_backoff'),
+        ("Max Retries:", 'retries_var', tk.IntVar, 'max_retries'),
+        ("Message Limit per Webhook:", 'limit_var', tk.IntVar, 'message_limit'),
+    )
+    _SETTINGS_SPEC = _ESSENTIAL_SPEC + _ADVANCED_SPEC
+
+    # ttk styling shared by every colored theme: (style name, configure options, state map).
+    # String values name a palette color, other values are passed through unchanged.
+    _STYLE_SPEC = (
+        ('.', {'background': 'bg', 'foreground': 'fg'}, None),
+        ('TFrame', {'background': 'bg'}, None),
+        ('TLabel', {'background': 'bg', 'foreground': 'fg'}, None),
+        ('TButton',
+         {'background': 'button_bg', 'foreground': 'button_fg', 'borderwidth': 1, 'focusthickness': 2, 'focuscolor': 'accent'},
+         {'background': [('active', 'button_bg'), ('pressed', 'accent'), ('!active', 'button_bg')],
+          'foreground': [('active', 'button_fg'), ('pressed', 'button_fg'), ('!active', 'button_fg')]}),
+        ('TCheckbutton',
+         {'background': 'bg', 'foreground': 'fg', 'indicatorcolor': 'accent', 'indicatordiameter': 12, 'bordercolor': 'accent', 'focuscolor': 'accent'},
+         {'background': [('active', 'bg'), ('selected', 'bg'), ('!active', 'bg')],
+          'foreground': [('active', 'fg'), ('selected', 'fg'), ('!active', 'fg')]}),
+        ('TNotebook', {'background': 'bg'}, None),
+        ('TNotebook.Tab',
+         {'background': 'button_bg', 'foreground': 'button_fg', 'lightcolor': 'accent', 'borderwidth': 0},
+         {'background': [('selected', 'accent'), ('active', 'button_bg'), ('!selected', 'button_bg')],
+          'foreground': [('selected', 'fg'), ('active', 'fg'), ('!selected', 'button_fg')]}),
+        ('TEntry',
+         {'fieldbackground': 'entry_bg', 'foreground': 'entry_fg', 'background': 'entry_bg', 'bordercolor': 'accent', 'lightcolor': 'accent',
+          'darkcolor': 'bg', 'highlightcolor': 'accent', 'selectbackground': 'accent', 'selectforeground': 'button_fg'},
+         {'fieldbackground': [('readonly', 'entry_bg'), ('!readonly', 'entry_bg'), ('active', 'entry_bg')],
+          'background': [('readonly', 'entry_bg'), ('!readonly', 'entry_bg'), ('active', 'entry_bg')],
+          'foreground': [('readonly', 'entry_fg'), ('!readonly', 'entry_fg'), ('active', 'entry_fg')],
+          'bordercolor': [('focus', 'accent'), ('!focus', 'accent')],
+          'highlightcolor': [('focus', 'accent'), ('!focus', 'accent')]}),
+        ('TCombobox',
+         {'fieldbackground': 'entry_bg', 'foreground': 'entry_fg', 'background': 'entry_bg', 'selectbackground': 'entry_bg', 'selectforeground': 'entry_fg',
+          'bordercolor': 'accent', 'lightcolor': 'accent', 'darkcolor': 'bg', 'highlightcolor': 'accent'},
+         {'fieldbackground': [('readonly', 'entry_bg'), ('!readonly', 'entry_bg'), ('active', 'entry_bg')],
+          'background': [('readonly', 'entry_bg'), ('!readonly', 'entry_bg'), ('active', 'entry_bg')],
+          'foreground': [('readonly', 'entry_fg'), ('!readonly', 'entry_fg'), ('active', 'entry_fg')],
+          'bordercolor': [('focus', 'accent'), ('!focus', 'accent')],
+          'highlightcolor': [('focus', 'accent'), ('!focus', 'accent')]}),
+        ('Horizontal.TProgressbar', {'background': 'accent', 'troughcolor': 'bg'}, None),
+    )
+
+    # Option database entries for classic Tk widgets: (pattern, palette color)
+    _OPTION_SPEC = (
+        ('*TCombobox*Listbox.background', 'entry_bg'),
+        ('*TCombobox*Listbox.foreground', 'entry_fg'),
+        ('*Entry.background', 'entry_bg'),
+        ('*Entry.foreground', 'entry_fg'),
+        ('*Entry.highlightBackground', 'accent'),
+        ('*Entry.highlightColor', 'accent'),
+        ('*Text.background', 'entry_bg'),
+        ('*Text.foreground', 'entry_fg'),
+        ('*foreground', 'fg'),
+        ('*background', 'bg'),
+    )
+    # Tcl lambda that adds a flat pattern/value list to the option database in one interpreter call
+    _OPTION_DB_LAMBDA = '{pairs} {foreach {pattern value} $pairs {option add $pattern $value}}'
+
     def __init__(self, root: tk.Tk, config_file: str):
         """Initialize the Oblivion V1 GUI with a config file."""
         # Set AppUserModelID for Windows taskbar icon before anything else
@@ -51,31 +185,50 @@ class OblivionGUI:
         self.config = self._load_config(self.config_file)
         self.webhook_groups = self._load_webhooks(resource_path(self.config['webhooks_file']))
         
-        # State variables for tracking running shards, message counts, threads, and mode
+        # State variables for tracking running shards, message counts, worker futures, and mode
         self.shard_status = {shard: False for shard in self.webhook_groups}  # Tracks whether each shard is running
-        self.message_counts = {}  # Tracks the number of messages sent per webhook URL
-        self.threads = {}  # Stores threads for each shard
+        # Per-shard parallel arrays: webhook URLs and the number of messages sent to each
+        self._shard_urls = {}
+        self._shard_counts = {}
+        self._sync_shard_arrays()
+        # Messages sent by each shard since it was last started, for Sequential mode progress
+        self.shard_message_totals = collections.defaultdict(int)
+        self._shard_total_counters = {}  # itertools.count per running shard, shared by its webhook loops
+        self._rate_limit_reset = {}  # Monotonic time at which each exhausted webhook's rate limit resets
+        self.futures = {}  # Stores the webhook loop futures for each shard
         self.mode = tk.StringVar(value="parallel")  # Stores the current mode: 'parallel' or 'sequential'
         self.current_switch_shard = None  # The currently active shard in Switch mode
+        self._switch_event = threading.Event()  # Set when the active Sequential shard may need switching
         self.rate_limit_backoff = self.config.get('rate_limit_backoff', self.DEFAULT_CONFIG['rate_limit_backoff'])
         self.max_retries = self.config.get('max_retries', self.DEFAULT_CONFIG['max_retries'])
         self.message_limit = self.config.get('message_limit', self.DEFAULT_CONFIG['message_limit'])
         self.total_pings = self.config.get('total_pings', self.DEFAULT_CONFIG['total_pings'])
-        # Define settings fields: (label, variable name, type, config key)
-        self._settings_fields = [
-            ("Message:", 'message_var', tk.StringVar, 'message'),
-            ("Username:", 'username_var', tk.StringVar, 'username'),
-            ("Avatar URL:", 'avatar_var', tk.StringVar, 'avatar_url'),
-            ("Delay (seconds):", 'delay_var', tk.DoubleVar, 'delay'),
-            ("Rate Limit Backoff (seconds):", 'backoff_var', tk.DoubleVar, 'rate_limit_backoff'),
-            ("Max Retries:", 'retries_var', tk.IntVar, 'max_retries'),
-            ("Message Limit per Webhook:", 'limit_var', tk.IntVar, 'message_limit'),
-            ("Total Pings per Shard (Sequential Mode):", 'total_pings_var', tk.IntVar, 'total_pings'),
-        ]
+        # Shared HTTP session: keeps connections to discord.com alive across all webhook requests
+        self.http = requests.Session()
+        self._http_pool_maxsize = 0
+        self._mount_http_adapter()
+        self.http.headers.update({"Content-Type": "application/json"})
+        # Resolve proxy and CA bundle settings from the environment once instead of on every request
+        self.http.proxies.update(requests.utils.get_environ_proxies('https://discord.com'))
+        ca_bundle = os.environ.get('REQUESTS_CA_BUNDLE') or os.environ.get('CURL_CA_BUNDLE')
+        if ca_bundle:
+            self.http.verify = ca_bundle
+        self.http.trust_env = False
+        # Worker threads are pooled and reused across Start/Stop cycles
+        self._pool = None
+        self._pool_size = 0
+        self._ensure_worker_pool()
         # Create all settings variables as attributes
-        for _, varname, vartype, key in self._settings_fields:
+        for _, varname, vartype, key in self._SETTINGS_SPEC:
             value = self.config.get(key, self.DEFAULT_CONFIG[key])
             setattr(self, varname, vartype(value=value))
+        # (config key, variable) pairs, resolved once for save and reset
+        self._settings_vars = [(key, getattr(self, varname)) for _, varname, _, key in self._SETTINGS_SPEC]
+        # Cache the serialized webhook payload and rebuild it only when its fields change
+        self._payload_bytes = b''
+        for varname in ('message_var', 'username_var', 'avatar_var'):
+            getattr(self, varname).trace_add('write', self._rebuild_payload)
+        self._rebuild_payload()
         # Set the window and taskbar icon
         self._set_window_icon(resource_path("icon.ico"))
         
@@ -84,41 +237,109 @@ class OblivionGUI:
         self.theme_options = ["Default"] + sorted(self.themes.keys()) + ["Custom"]
         self.theme_var = tk.StringVar(value='Default')
         self.config['theme'] = self.config.get('theme', 'Default')
+        # Custom theme colors live here rather than in the Settings tab, which is built lazily
+        self.custom_color_vars = {
+            'bg': tk.StringVar(value=self.config.get('custom_theme', {}).get('bg', '#181818')),
+            'fg': tk.StringVar(value=self.config.get('custom_theme', {}).get('fg', '#f8f8f2')),
+            'accent': tk.StringVar(value=self.config.get('custom_theme', {}).get('accent', '#6c3483')),
+            'entry_bg': tk.StringVar(value=self.config.get('custom_theme', {}).get('entry_bg', '#23272e')),
+            'entry_fg': tk.StringVar(value=self.config.get('custom_theme', {}).get('entry_fg', '#f8f8f2')),
+        }
         
         # Build the GUI layout and widgets
         self._setup_gui()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _retry_policy(self):
+        """Build the urllib3 Retry policy for webhook POSTs from the current max_retries setting."""
+        return Retry(
+            total=max(self.max_retries - 1, 0),  # max_retries counts attempts, Retry counts re-sends
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['POST']),
+            respect_retry_after_header=True,
+            raise_on_status=False,  # Hand back the last response instead of raising
+        )
 
-    def _load_file_with_error_handling(self, path, loader, filetype):
+    def _mount_http_adapter(self):
+        """Mount a retrying connection pool large enough for one keep-alive connection per webhook thread."""
+        # urllib3 discards connections returned to a full pool, so size it to the webhook count
+        webhook_count = sum(len(urls) for urls in self.webhook_groups.values())
+        pool_maxsize = max(128, webhook_count)
+        if self._http_pool_maxsize >= pool_maxsize:
+            return
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_maxsize, max_retries=self._retry_policy())
+        # The old adapter is left open: requests in flight (including ones urllib3 is retrying)
+        # finish on its pools, which are released once it is garbage collected
+        self.http.mount('https://', adapter)
+        self._http_pool_maxsize = pool_maxsize
+
+    def _sync_shard_arrays(self):
+        """Keep the shard order, per-shard URL lists, and message count arrays in step with webhook_groups."""
+        self._shard_names = list(self.webhook_groups)
+        self._shard_index = {name: i for i, name in enumerate(self._shard_names)}
+        for shard, urls in self.webhook_groups.items():
+            if self._shard_urls.get(shard) != urls:
+                self._shard_urls[shard] = list(urls)
+                self._shard_counts[shard] = array('I', [0]) * len(urls)
+        for shard in set(self._shard_urls) - set(self.webhook_groups):
+            del self._shard_urls[shard]
+            del self._shard_counts[shard]
+
+    def _ensure_worker_pool(self):
+        """Grow the worker pool so every webhook loop can run at the same time."""
+        webhook_count = sum(len(urls) for urls in self.webhook_groups.values())
+        if self._pool is not None and self._pool_size >= webhook_count:
+            return
+        old_pool = self._pool
+        self._pool_size = max(32, webhook_count)
+        self._pool = ThreadPoolExecutor(max_workers=self._pool_size, thread_name_prefix='oblivion-webhook')
+        if old_pool is not None:
+            # Loops already running on the old pool keep going until their shard stops
+            old_pool.shutdown(wait=False)
+
+    def _load_file_with_error_handling(self, path, loader, filetype, mode='r'):
         """Generic file loader with error handling for config and webhooks."""
         try:
-            with open(path, 'r') as file:
+            with open(path, mode) as file:
                 data = loader(file)
                 if not data:
                     raise ValueError(f"Empty {filetype} file")
                 return data
         except FileNotFoundError:
-            logger.error(f"{filetype.capitalize()} file {path} not found")
+            logger.error("%s file %s not found", filetype.capitalize(), path)
             messagebox.showerror("Error", f"{filetype.capitalize()} file {path} not found")
             exit(1)
         except Exception as e:
-            logger.error(f"Invalid {filetype} in {path}: {e}")
+            logger.error("Invalid %s in %s: %s", filetype, path, e)
             messagebox.showerror("Error", f"Invalid {filetype} in {path}: {e}")
             exit(1)
 
     def _load_config(self, config_file: str) -> Dict:
         """Load and validate the YAML configuration file. Show an error and exit if invalid."""
-        return self._load_file_with_error_handling(config_file, yaml.safe_load, "config")
+        return self._load_file_with_error_handling(config_file, lambda f: yaml.load(f, Loader=YamlLoader), "config")
 
     def _load_webhooks(self, json_file: str) -> Dict:
         """Load and validate webhook groups from a JSON file. Show an error and exit if invalid."""
-        return self._load_file_with_error_handling(json_file, json.load, "webhook")
+        loader = load_json
+        if ijson is not None and os.path.isfile(json_file) and os.path.getsize(json_file) > WEBHOOK_STREAM_THRESHOLD:
+            loader = self._stream_webhook_groups
+        return self._load_file_with_error_handling(json_file, loader, "webhook", mode='rb')
+
+    def _stream_webhook_groups(self, file) -> Dict:
+        """Parse webhook groups incrementally, letting Tk process idle work between groups."""
+        groups = {}
+        for name, urls in ijson.kvitems(file, ''):
+            groups[name] = urls
+            self.root.update_idletasks()
+        return groups
 
     def _load_themes(self, path):
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
+            with open(path, 'rb') as f:
+                return load_json(f)
         except Exception as e:
-            logger.warning(f"Could not load themes from {path}: {e}")
+            logger.warning("Could not load themes from %s: %s", path, e)
             return {}
 
     def _set_window_icon(self, icon_path: str):
@@ -129,14 +350,16 @@ class OblivionGUI:
             else:
                 # For other platforms, fallback to PhotoImage if possible
                 self.root.iconphoto(True, tk.PhotoImage(file=icon_path))
-            logger.info(f"Loaded icon: {icon_path}")
+            logger.info("Loaded icon: %s", icon_path)
         except Exception as e:
-            logger.warning(f"Failed to load icon {icon_path}: {e}")
+            logger.warning("Failed to load icon %s: %s", icon_path, e)
             messagebox.showwarning("Warning", f"Failed to load icon: {e}")
 
     def _setup_gui(self):
         self.main_frame = ttk.Frame(self.root, padding="10")
         self.main_frame.grid(row=0, column=0, sticky="nsew")
+        # One Style handle shared by every theme apply
+        self._style = ttk.Style(self.root)
 
         # Create a notebook widget to hold the different tabs
         self.notebook = ttk.Notebook(self.main_frame)
@@ -150,17 +373,24 @@ class OblivionGUI:
         # Settings tab: for configuring message and other parameters
         self.settings_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.settings_tab, text="Settings")
-        self._setup_settings_tab()
 
         # Info tab: for guidelines, license, and warnings
         self.info_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.info_tab, text="Info")
-        self._setup_info_tab()
+
+        # Settings and Info are only built the first time they are selected
+        self._tab_builders = {
+            str(self.settings_tab): self._setup_settings_tab,
+            str(self.info_tab): self._setup_info_tab,
+        }
+        self.notebook.bind('<<NotebookTabChanged>>', self._lazy_build_tab)
 
         # Log display: shows logs in a scrollable text widget
         self.log_text = scrolledtext.ScrolledText(self.main_frame, height=10, width=60, state='disabled')
         self.log_text.grid(row=1, column=0, columnspan=3, pady=10, sticky="ew")
-        logger.addHandler(TextHandler(self.log_text))
+        self.log_handler = TextHandler(self.log_text)
+        self.log_handler.setLevel(logging.INFO)  # Never format DEBUG records into the GUI buffer
+        logger.addHandler(self.log_handler)
 
         # Button to hide/show logs
         self.toggle_logs_button = ttk.Button(self.main_frame, text="Hide Logs", command=self._toggle_logs)
@@ -181,6 +411,12 @@ class OblivionGUI:
         theme = self.config.get('theme', 'Default')
         self._apply_theme(theme)
 
+    def _lazy_build_tab(self, event=None):
+        """Build the selected tab's widgets on first view."""
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder is not None:
+            builder()
+
     def _set_start_stop_state(self, start_enabled: bool, stop_enabled: bool):
         """Helper to set the state of start and stop buttons."""
         self.start_button.config(state="normal" if start_enabled else "disabled")
@@ -238,10 +474,8 @@ class OblivionGUI:
         # Ping Farm Settings
         ping_frame = ttk.LabelFrame(self.settings_tab, text="Ping Farm Settings", padding="10")
         ping_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=5, padx=5)
-        essentials = [0, 1, 2, 3, 7]
-        for idx, (label, varname, _, _) in enumerate(self._settings_fields):
-            if idx in essentials:
-                add_row(ping_frame, label, getattr(self, varname), idx)
+        for row, (label, varname, _, _) in enumerate(self._ESSENTIAL_SPEC):
+            add_row(ping_frame, label, getattr(self, varname), row)
         ping_frame.columnconfigure(1, weight=1)
         # Advanced Options
         self.advanced_visible = tk.BooleanVar(value=False)
@@ -258,9 +492,8 @@ class OblivionGUI:
         advanced_frame = ttk.LabelFrame(self.settings_tab, text="Advanced Options", padding="10")
         advanced_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=5, padx=5)
         advanced_frame.grid_remove()
-        for i, idx in enumerate([4, 5, 6]):
-            label, varname, _, _ = self._settings_fields[idx]
-            add_row(advanced_frame, label, getattr(self, varname), i)
+        for row, (label, varname, _, _) in enumerate(self._ADVANCED_SPEC):
+            add_row(advanced_frame, label, getattr(self, varname), row)
         advanced_frame.columnconfigure(1, weight=1)
         # Preferences
         pref_frame = ttk.LabelFrame(self.settings_tab, text="Preferences", padding="10")
@@ -270,15 +503,9 @@ class OblivionGUI:
         theme_combo.grid(row=0, column=1, sticky="ew", pady=3, padx=5)
         theme_combo.bind("<<ComboboxSelected>>", lambda e: self._on_theme_selected())
         pref_frame.columnconfigure(1, weight=1)
-        self.custom_color_vars = {
-            'bg': tk.StringVar(value=self.config.get('custom_theme', {}).get('bg', '#181818')),
-            'fg': tk.StringVar(value=self.config.get('custom_theme', {}).get('fg', '#f8f8f2')),
-            'accent': tk.StringVar(value=self.config.get('custom_theme', {}).get('accent', '#6c3483')),
-            'entry_bg': tk.StringVar(value=self.config.get('custom_theme', {}).get('entry_bg', '#23272e')),
-            'entry_fg': tk.StringVar(value=self.config.get('custom_theme', {}).get('entry_fg', '#f8f8f2')),
-        }
         self.custom_color_labels = {}
         self.custom_color_entries = {}
+        self._custom_theme_after = None  # Pending debounced re-apply of the custom theme
         row = 1
         for key, label in zip(['bg', 'fg', 'accent', 'entry_bg', 'entry_fg'], ["Background", "Foreground", "Accent", "Entry Background", "Entry Foreground"]):
             lbl = ttk.Label(pref_frame, text=label+':')
@@ -287,7 +514,7 @@ class OblivionGUI:
             self.custom_color_entries[key] = ent
             lbl.grid(row=row, column=0, sticky=tk.W, pady=2, padx=5)
             ent.grid(row=row, column=1, sticky="ew", pady=2, padx=5)
-            ent.bind('<KeyRelease>', lambda e: self._apply_custom_theme(save=True))
+            ent.bind('<KeyRelease>', self._schedule_custom_theme)
             row += 1
         self._show_hide_custom_colors()
         # Save/Reset buttons
@@ -328,63 +555,48 @@ class OblivionGUI:
             self.config['theme'] = theme_name
         self._refresh_theme_widgets()
 
-    def _apply_json_theme(self, theme_name):
-        style = ttk.Style()
+    def _apply_theme_dict(self, colors):
+        """Apply a color palette (bg, fg, accent, entry_bg, entry_fg, button_bg, button_fg) to all widgets."""
+        # Palette values reach Tcl, so only apply ones Tk can parse as colors
+        for key, value in colors.items():
+            try:
+                self.root.winfo_rgb(value)
+            except tk.TclError:
+                logger.warning("Ignoring theme with invalid %s color: %r", key, value)
+                return False
+        style = self._style
         style.theme_use('clam')
-        t = self.themes[theme_name]
-        bg = t['bg']
-        fg = t['fg']
-        accent = t['accent']
-        entry_bg = t['entry_bg']
-        entry_fg = t['entry_fg']
-        button_bg = t.get('button_bg', entry_bg)
-        button_fg = t.get('button_fg', entry_fg)
-        style.configure('.', background=bg, foreground=fg)
-        style.configure('TFrame', background=bg)
-        style.configure('TLabel', background=bg, foreground=fg)
-        style.configure('TButton', background=button_bg, foreground=button_fg, borderwidth=1, focusthickness=2, focuscolor=accent)
-        style.map('TButton',
-            background=[('active', button_bg), ('pressed', accent), ('!active', button_bg)],
-            foreground=[('active', button_fg), ('pressed', button_fg), ('!active', button_fg)])
-        style.configure('TCheckbutton', background=bg, foreground=fg, indicatorcolor=accent, indicatordiameter=12, bordercolor=accent, focuscolor=accent)
-        style.map('TCheckbutton',
-            background=[('active', bg), ('selected', bg), ('!active', bg)],
-            foreground=[('active', fg), ('selected', fg), ('!active', fg)])
-        style.configure('TNotebook', background=bg)
-        style.configure('TNotebook.Tab', background=button_bg, foreground=button_fg, lightcolor=accent, borderwidth=0)
-        style.map('TNotebook.Tab',
-            background=[('selected', accent), ('active', button_bg), ('!selected', button_bg)],
-            foreground=[('selected', fg), ('active', fg), ('!selected', button_fg)])
-        style.configure('TEntry', fieldbackground=entry_bg, foreground=entry_fg, background=entry_bg, bordercolor=accent, lightcolor=accent, darkcolor=bg, highlightcolor=accent, selectbackground=accent, selectforeground=button_fg)
-        style.map('TEntry',
-            fieldbackground=[('readonly', entry_bg), ('!readonly', entry_bg), ('active', entry_bg)],
-            background=[('readonly', entry_bg), ('!readonly', entry_bg), ('active', entry_bg)],
-            foreground=[('readonly', entry_fg), ('!readonly', entry_fg), ('active', entry_fg)],
-            bordercolor=[('focus', accent), ('!focus', accent)],
-            highlightcolor=[('focus', accent), ('!focus', accent)])
-        style.configure('TCombobox', fieldbackground=entry_bg, foreground=entry_fg, background=entry_bg, selectbackground=entry_bg, selectforeground=entry_fg, bordercolor=accent, lightcolor=accent, darkcolor=bg, highlightcolor=accent)
-        style.map('TCombobox',
-            fieldbackground=[('readonly', entry_bg), ('!readonly', entry_bg), ('active', entry_bg)],
-            background=[('readonly', entry_bg), ('!readonly', entry_bg), ('active', entry_bg)],
-            foreground=[('readonly', entry_fg), ('!readonly', entry_fg), ('active', entry_fg)],
-            bordercolor=[('focus', accent), ('!focus', accent)],
-            highlightcolor=[('focus', accent), ('!focus', accent)])
-        style.configure('Horizontal.TProgressbar', background=accent, troughcolor=bg)
-        self.root.option_add('*TCombobox*Listbox.background', entry_bg)
-        self.root.option_add('*TCombobox*Listbox.foreground', entry_fg)
-        self.root.option_add('*Entry.background', entry_bg)
-        self.root.option_add('*Entry.foreground', entry_fg)
-        self.root.option_add('*Entry.highlightBackground', accent)
-        self.root.option_add('*Entry.highlightColor', accent)
-        self.root.option_add('*Text.background', entry_bg)
-        self.root.option_add('*Text.foreground', entry_fg)
-        self.root.option_add('*foreground', fg)
-        self.root.option_add('*background', bg)
+
+        def resolve(value):
+            # Strings name a palette color; anything else (widths, sizes) is used as-is
+            return colors[value] if isinstance(value, str) else value
+
+        # configure/map pass every value as its own Tcl argument, so nothing in a palette is evaluated
+        for style_name, options, state_map in self._STYLE_SPEC:
+            style.configure(style_name, **{opt: resolve(v) for opt, v in options.items()})
+            if state_map:
+                style.map(style_name, **{opt: [(state, resolve(v)) for state, v in states]
+                                         for opt, states in state_map.items()})
+        pairs = tuple(item for pattern, key in self._OPTION_SPEC for item in (pattern, colors[key]))
+        self.root.tk.call('apply', self._OPTION_DB_LAMBDA, pairs)
         if hasattr(self, 'log_text'):
-            self.log_text.config(bg=entry_bg, fg=entry_fg, insertbackground=entry_fg)
+            self.log_text.config(bg=colors['entry_bg'], fg=colors['entry_fg'], insertbackground=colors['entry_fg'])
+        return True
+
+    def _apply_json_theme(self, theme_name):
+        t = self.themes[theme_name]
+        self._apply_theme_dict({
+            'bg': t['bg'],
+            'fg': t['fg'],
+            'accent': t['accent'],
+            'entry_bg': t['entry_bg'],
+            'entry_fg': t['entry_fg'],
+            'button_bg': t.get('button_bg', t['entry_bg']),
+            'button_fg': t.get('button_fg', t['entry_fg']),
+        })
 
     def _apply_default_theme(self):
-        style = ttk.Style()
+        style = self._style
         style.theme_use('default')
         # Remove any custom option_adds for widgets
         self.root.option_clear()
@@ -392,61 +604,22 @@ class OblivionGUI:
             self.log_text.config(bg='white', fg='black', insertbackground='black')
 
     def _apply_custom_theme(self, save=False):
-        style = ttk.Style()
-        style.theme_use('clam')
-        bg = self.custom_color_vars['bg'].get()
-        fg = self.custom_color_vars['fg'].get()
-        accent = self.custom_color_vars['accent'].get()
-        entry_bg = self.custom_color_vars['entry_bg'].get()
-        entry_fg = self.custom_color_vars['entry_fg'].get()
-        button_bg = entry_bg
-        button_fg = entry_fg
-        style.configure('.', background=bg, foreground=fg)
-        style.configure('TFrame', background=bg)
-        style.configure('TLabel', background=bg, foreground=fg)
-        style.configure('TButton', background=button_bg, foreground=button_fg, borderwidth=1, focusthickness=2, focuscolor=accent)
-        style.map('TButton',
-            background=[('active', button_bg), ('pressed', accent), ('!active', button_bg)],
-            foreground=[('active', button_fg), ('pressed', button_fg), ('!active', button_fg)])
-        style.configure('TCheckbutton', background=bg, foreground=fg, indicatorcolor=accent, indicatordiameter=12, bordercolor=accent, focuscolor=accent)
-        style.map('TCheckbutton',
-            background=[('active', bg), ('selected', bg), ('!active', bg)],
-            foreground=[('active', fg), ('selected', fg), ('!active', fg)])
-        style.configure('TNotebook', background=bg)
-        style.configure('TNotebook.Tab', background=button_bg, foreground=button_fg, lightcolor=accent, borderwidth=0)
-        style.map('TNotebook.Tab',
-            background=[('selected', accent), ('active', button_bg), ('!selected', button_bg)],
-            foreground=[('selected', fg), ('active', fg), ('!selected', button_fg)])
-        style.configure('TEntry', fieldbackground=entry_bg, foreground=entry_fg, background=entry_bg, bordercolor=accent, lightcolor=accent, darkcolor=bg, highlightcolor=accent, selectbackground=accent, selectforeground=button_fg)
-        style.map('TEntry',
-            fieldbackground=[('readonly', entry_bg), ('!readonly', entry_bg), ('active', entry_bg)],
-            background=[('readonly', entry_bg), ('!readonly', entry_bg), ('active', entry_bg)],
-            foreground=[('readonly', entry_fg), ('!readonly', entry_fg), ('active', entry_fg)],
-            bordercolor=[('focus', accent), ('!focus', accent)],
-            highlightcolor=[('focus', accent), ('!focus', accent)])
-        style.configure('TCombobox', fieldbackground=entry_bg, foreground=entry_fg, background=entry_bg, selectbackground=entry_bg, selectforeground=entry_fg, bordercolor=accent, lightcolor=accent, darkcolor=bg, highlightcolor=accent)
-        style.map('TCombobox',
-            fieldbackground=[('readonly', entry_bg), ('!readonly', entry_bg), ('active', entry_bg)],
-            background=[('readonly', entry_bg), ('!readonly', entry_bg), ('active', entry_bg)],
-            foreground=[('readonly', entry_fg), ('!readonly', entry_fg), ('active', entry_fg)],
-            bordercolor=[('focus', accent), ('!focus', accent)],
-            highlightcolor=[('focus', accent), ('!focus', accent)])
-        style.configure('Horizontal.TProgressbar', background=accent, troughcolor=bg)
-        self.root.option_add('*TCombobox*Listbox.background', entry_bg)
-        self.root.option_add('*TCombobox*Listbox.foreground', entry_fg)
-        self.root.option_add('*Entry.background', entry_bg)
-        self.root.option_add('*Entry.foreground', entry_fg)
-        self.root.option_add('*Entry.highlightBackground', accent)
-        self.root.option_add('*Entry.highlightColor', accent)
-        self.root.option_add('*Text.background', entry_bg)
-        self.root.option_add('*Text.foreground', entry_fg)
-        self.root.option_add('*foreground', fg)
-        self.root.option_add('*background', bg)
-        if hasattr(self, 'log_text'):
-            self.log_text.config(bg=entry_bg, fg=entry_fg, insertbackground=entry_fg)
-        if save:
+        colors = {k: v.get() for k, v in self.custom_color_vars.items()}
+        colors['button_bg'] = colors['entry_bg']
+        colors['button_fg'] = colors['entry_fg']
+        if self._apply_theme_dict(colors) and save:
             self.config['custom_theme'] = {k: v.get() for k, v in self.custom_color_vars.items()}
 
+    def _schedule_custom_theme(self, event=None):
+        """Debounce custom color edits so the theme is re-applied at most once per 150 ms of typing."""
+        if self._custom_theme_after is not None:
+            self.root.after_cancel(self._custom_theme_after)
+        self._custom_theme_after = self.root.after(150, self._run_scheduled_custom_theme)
+
+    def _run_scheduled_custom_theme(self):
+        self._custom_theme_after = None
+        self._apply_custom_theme(save=True)
+
     def _setup_info_tab(self):
         """Set up the Info tab with a modern, visually appealing layout, icons, and a warning box."""
         # Clear any existing widgets
@@ -510,8 +683,8 @@ class OblivionGUI:
         self.info_tab.rowconfigure(8, weight=1)
 
     def _reset_config(self):
-        for _, varname, _, key in self._settings_fields:
-            getattr(self, varname).set(self.DEFAULT_CONFIG[key])
+        for key, var in self._settings_vars:
+            var.set(self.DEFAULT_CONFIG[key])
         self.theme_var.set('Default')
         self._apply_theme('Default', save=True)
         messagebox.showinfo("Success", "Configuration reset to default values")
@@ -520,10 +693,11 @@ class OblivionGUI:
         """Update the shard selection UI based on the selected mode (Parallel or Sequential)."""
         for widget in self.shard_frame.winfo_children():
             widget.destroy()
+        # Drop references to the destroyed checkbuttons so they aren't configured or kept alive
+        self.shard_checkbuttons = {}
         if self.mode.get() == "parallel":
             # In Parallel mode, show checkboxes for each shard
             self.shard_states = {shard: tk.BooleanVar(value=False) for shard in self.webhook_groups}
-            self.shard_checkbuttons = {}
             for row, (shard, var) in enumerate(self.shard_states.items()):
                 cb = ttk.Checkbutton(self.shard_frame, text=shard, variable=var)
                 cb.grid(row=row, column=0, sticky=tk.W, pady=2, padx=5)
@@ -543,7 +717,6 @@ class OblivionGUI:
             self.switch_shard_combo = combo
 
     def _setup_manage_shards_in_settings(self, parent):
-        from tkinter import filedialog
         def add_row(frame, label, var, row):
             ttk.Label(frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=3, padx=5)
             ttk.Entry(frame, textvariable=var).grid(row=row, column=1, sticky="ew", pady=3, padx=5)
@@ -586,7 +759,6 @@ class OblivionGUI:
                 self.del_group_var.set("")
 
     def _add_shard_group(self):
-        import json
         group_name = self.add_group_name_var.get().strip()
         json_path = self.add_json_path_var.get().strip()
         if not group_name:
@@ -596,50 +768,67 @@ class OblivionGUI:
             messagebox.showerror("Error", "Please select a valid JSON file.")
             return
         try:
-            with open(json_path, 'r') as f:
-                webhooks = json.load(f)
-            if not isinstance(webhooks, list) or not all(isinstance(url, str) for url in webhooks):
+            with open(json_path, 'rb') as f:
+                webhooks = load_json(f)
+            if type(webhooks) is not list:
                 raise ValueError("JSON must be a list of webhook URLs.")
-            # Load current webhooks.json
-            with open(resource_path(self.config['webhooks_file']), 'r') as f:
-                all_groups = json.load(f)
-            if group_name in all_groups:
+            bad = next((url for url in webhooks if type(url) is not str), _MISSING)
+            if bad is not _MISSING:
+                raise ValueError(f"JSON must be a list of webhook URLs (non-string entry: {bad!r}).")
+            # The loaded webhook_groups are the source of truth; only write them back out
+            if group_name in self.webhook_groups:
                 messagebox.showerror("Error", f"Group '{group_name}' already exists.")
                 return
+            all_groups = dict(self.webhook_groups)
             all_groups[group_name] = webhooks
-            with open(resource_path(self.config['webhooks_file']), 'w') as f:
-                json.dump(all_groups, f, indent=2)
+            write_file_atomic(resource_path(self.config['webhooks_file']), lambda f: dump_json(all_groups, f), mode='wb')
             self.webhook_groups = all_groups
+            self._sync_shard_arrays()
+            self._mount_http_adapter()
+            self._ensure_worker_pool()
             self._refresh_shard_group_combo()
             self._update_shard_ui()
             messagebox.showinfo("Success", f"Group '{group_name}' added successfully.")
         except Exception as e:
-            logger.error(f"Failed to add shard group: {e}")
+            logger.error("Failed to add shard group: %s", e)
             messagebox.showerror("Error", f"Failed to add group: {e}")
 
     def _delete_shard_group(self):
-        import json
         group_name = self.del_group_var.get().strip()
         if not group_name:
             messagebox.showerror("Error", "Please select a group to delete.")
             return
         try:
-            with open(resource_path(self.config['webhooks_file']), 'r') as f:
-                all_groups = json.load(f)
-            if group_name not in all_groups:
+            if group_name not in self.webhook_groups:
                 messagebox.showerror("Error", f"Group '{group_name}' does not exist.")
                 return
-            del all_groups[group_name]
-            with open(resource_path(self.config['webhooks_file']), 'w') as f:
-                json.dump(all_groups, f, indent=2)
+            if self.shard_status.get(group_name, False):
+                messagebox.showerror("Error", f"Group '{group_name}' is running. Stop it before deleting it.")
+                return
+            all_groups = dict(self.webhook_groups)
+            removed_urls = all_groups.pop(group_name)
+            write_file_atomic(resource_path(self.config['webhooks_file']), lambda f: dump_json(all_groups, f), mode='wb')
             self.webhook_groups = all_groups
+            self._teardown_shard_state(group_name, removed_urls)
+            self._sync_shard_arrays()
             self._refresh_shard_group_combo()
             self._update_shard_ui()
             messagebox.showinfo("Success", f"Group '{group_name}' deleted successfully.")
         except Exception as e:
-            logger.error(f"Failed to delete shard group: {e}")
+            logger.error("Failed to delete shard group: %s", e)
             messagebox.showerror("Error", f"Failed to delete group: {e}")
 
+    def _teardown_shard_state(self, shard_name: str, webhook_urls: List[str]):
+        """Forget all per-shard bookkeeping for a deleted shard so it doesn't accumulate across edits."""
+        self.shard_status.pop(shard_name, None)
+        self.futures.pop(shard_name, None)
+        self.shard_message_totals.pop(shard_name, None)
+        self._shard_total_counters.pop(shard_name, None)
+        still_used = {url for urls in self.webhook_groups.values() for url in urls}
+        for url in webhook_urls:
+            if url not in still_used:
+                self._rate_limit_reset.pop(url, None)
+
     def _set_shard_checkboxes_state(self, enabled: bool):
         """Enable or disable all shard checkboxes in Parallel mode."""
         if hasattr(self, 'shard_checkbuttons'):
@@ -656,102 +845,155 @@ class OblivionGUI:
     def _save_config(self):
         """Save the current configuration values to the YAML config file and update runtime variables."""
         try:
-            for _, varname, _, key in self._settings_fields:
-                self.config[key] = getattr(self, varname).get()
+            for key, var in self._settings_vars:
+                self.config[key] = var.get()
             self.config['theme'] = self.theme_var.get()
             if self.theme_var.get() == 'Custom':
                 self.config['custom_theme'] = {k: v.get() for k, v in self.custom_color_vars.items()}
-            with open(self.config_file, 'w') as file:
-                yaml.safe_dump(self.config, file)
+            write_file_atomic(self.config_file,
+                              lambda file: yaml.dump(self.config, file, Dumper=YamlDumper, default_flow_style=False))
             messagebox.showinfo("Success", "Configuration saved successfully")
             # Update runtime variables to reflect new settings
             self.rate_limit_backoff = getattr(self, 'backoff_var').get()
             self.max_retries = getattr(self, 'retries_var').get()
             self.message_limit = getattr(self, 'limit_var').get()
             self.total_pings = getattr(self, 'total_pings_var').get()
+            # Swap the retry policy on the live adapter so its keep-alive pools stay open
+            self.http.get_adapter('https://discord.com').max_retries = self._retry_policy()
         except Exception as e:
-            logger.error(f"Failed to save config: {e}")
+            logger.error("Failed to save config: %s", e)
             messagebox.showerror("Error", f"Failed to save config: {e}")
 
-    def _send_webhook(self, webhook_url: str, message: str, username: Optional[str], 
-                     avatar_url: Optional[str], shard_name: str) -> bool:
-        """Send a single webhook message, handling rate limits and retries as needed."""
-        payload = {"content": message}
+    def _rebuild_payload(self, *_):
+        """Serialize the webhook payload from the current message, username, and avatar fields."""
+        payload = {"content": self.message_var.get()}
+        username = self.username_var.get()
+        avatar_url = self.avatar_var.get()
         if username:
             payload["username"] = username
         if avatar_url:
             payload["avatar_url"] = avatar_url
-
-        headers = {"Content-Type": "application/json"}
-
-        for attempt in range(self.max_retries):
+        self._payload_bytes = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+    def _send_webhook(self, webhook_url: str, request: requests.PreparedRequest, shard_name: str, counts: array, index: int,
+                      counter: Iterator[int]) -> bool:
+        """Send a single webhook message; the HTTP adapter retries errors and waits out 429s."""
+        # Wait out a rate limit bucket that the last response reported as exhausted
+        wait_for = self._rate_limit_reset.get(webhook_url, 0) - time.monotonic()
+        if wait_for > 0:
+            time.sleep(wait_for)
+        try:
+            response = self.http.send(request, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            # Network or request error that outlasted the adapter's retries
+            logger.error("Error sending to %s: %s", webhook_url, e)
+            return False
+        self._track_rate_limit(webhook_url, response)
+        if response.status_code == 204:
+            # Message sent successfully; increment the count
+            count = next(counter)
+            counts[index] = count  # Publish for the progress readers
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Sent message to %s (Count: %d)", webhook_url, count)
+            # next() on a shared count is atomic under the GIL, unlike += on the dict entry
+            total = next(self._shard_total_counters[shard_name])
+            self.shard_message_totals[shard_name] = total
+            if shard_name == self.current_switch_shard and total >= self.total_pings:
+                self._switch_event.set()  # Wake the Sequential monitor to switch shards
+            # Update Switch mode status if applicable
+            if self.mode.get() == "sequential" and shard_name == self.current_switch_shard:
+                self._update_switch_status()
+            return True
+        if response.status_code == 429:
+            # Still rate limited after retries; Discord gives the wait in seconds in Retry-After (or the JSON body)
+            retry_header = response.headers.get('Retry-After')
+            retry_after = self.rate_limit_backoff
             try:
-                response = requests.post(webhook_url, json=payload, headers=headers)
-                if response.status_code == 204:
-                    # Message sent successfully; increment the count
-                    self.message_counts[webhook_url] = self.message_counts.get(webhook_url, 0) + 1
-                    logger.info(f"Sent message to {webhook_url} (Count: {self.message_counts[webhook_url]})")
-                    # Update Switch mode status if applicable
-                    if self.mode.get() == "sequential" and shard_name == self.current_switch_shard:
-                        self._update_switch_status()
-                    return True
-                elif response.status_code == 429:
-                    # Rate limited; wait for the specified retry_after time
-                    retry_after = response.json().get('retry_after', self.rate_limit_backoff) / 1000
-                    logger.warning(f"Rate limited on {webhook_url}. Waiting {retry_after}s")
-                    time.sleep(retry_after)
+                if retry_header:
+                    retry_after = float(retry_header)
                 else:
-                    # Other error; log and return failure
-                    logger.error(f"Failed to send to {webhook_url}. Status: {response.status_code}, Response: {response.text}")
-                    return False
-            except requests.RequestException as e:
-                # Network or request error; retry if attempts remain
-                logger.error(f"Error sending to {webhook_url}: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.rate_limit_backoff)
-        logger.error(f"Max retries reached for {webhook_url}")
+                    # Decode the raw bytes directly; response.json() would run charset detection first
+                    body = json.loads(response.content)
+                    if isinstance(body, dict):
+                        retry_after = float(body.get('retry_after', self.rate_limit_backoff))
+            except (ValueError, TypeError):
+                retry_after = self.rate_limit_backoff
+            if not 0 <= retry_after < float('inf'):  # Also rejects NaN, which time.sleep can't take
+                retry_after = self.rate_limit_backoff
+            logger.warning("Rate limited on %s. Waiting %ss", webhook_url, retry_after)
+            time.sleep(retry_after)
+            return False
+        # Other error; log and return failure
+        logger.error("Failed to send to %s. Status: %s, Response: %s", webhook_url, response.status_code, response.text)
         return False
 
-    def _webhook_loop(self, webhook_url: str, message: str, username: str, avatar_url: str, 
-                     delay: float, shard_name: str):
+    def _track_rate_limit(self, webhook_url: str, response):
+        """Remember when a webhook's rate limit resets if the response says no requests remain."""
+        reset_after = response.headers.get('X-RateLimit-Reset-After')
+        if reset_after and response.headers.get('X-RateLimit-Remaining') == '0':
+            self._rate_limit_reset[webhook_url] = time.monotonic() + float(reset_after)
+
+    def _webhook_loop(self, webhook_url: str, request: requests.PreparedRequest, delay: float, shard_name: str,
+                      counts: array, index: int):
         """Continuously send messages to a webhook until stopped or the message limit is reached."""
-        while self.shard_status.get(shard_name, False) and self.message_counts.get(webhook_url, 0) < self.message_limit:
-            self._send_webhook(webhook_url, message, username, avatar_url, shard_name)
-            time.sleep(delay)
+        # This loop is the only writer of counts[index]; the counter hands out each new count
+        counter = itertools.count(counts[index] + 1)
+        # Bind hot lookups to locals; the limit, like delay and the request, is fixed for this launch
+        status = self.shard_status
+        limit = self.message_limit
+        send = self._send_webhook
+        monotonic = time.monotonic
+        # Pace sends against a monotonic deadline so request time doesn't stretch the interval
+        deadline = monotonic()
+        while status.get(shard_name, False) and counts[index] < limit:
+            send(webhook_url, request, shard_name, counts, index, counter)
+            deadline += delay
+            remaining = deadline - monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                # Fell behind (slow request or rate limit wait); restart the schedule instead of bursting
+                deadline = monotonic()
 
     def _start_shard(self, shard_name: str):
-        """Start sending messages for a shard by launching threads for each webhook URL."""
+        """Start sending messages for a shard by submitting a loop for each webhook URL to the worker pool."""
         self.shard_status[shard_name] = True
-        self.threads[shard_name] = []
-        webhook_urls = self.webhook_groups[shard_name]
-        message = getattr(self, 'message_var').get()
-        username = getattr(self, 'username_var').get()
-        avatar_url = getattr(self, 'avatar_var').get()
+        self.futures[shard_name] = []
+        self.shard_message_totals[shard_name] = 0
+        self._shard_total_counters[shard_name] = itertools.count(1)
+        webhook_urls = self._shard_urls[shard_name]
+        counts = self._shard_counts[shard_name]
+        body = self._payload_bytes  # Snapshot so edits made while running don't affect this shard
         delay = getattr(self, 'delay_var').get()
 
-        for webhook_url in webhook_urls:
-            # Initialize message count if not already set
-            self.message_counts[webhook_url] = self.message_counts.get(webhook_url, 0)
-            thread = threading.Thread(
-                target=self._webhook_loop,
-                args=(webhook_url, message, username, avatar_url, delay, shard_name),
-                daemon=False
-            )
-            self.threads[shard_name].append(thread)
-            thread.start()
-        logger.info(f"Started shard: {shard_name}")
+        for index, webhook_url in enumerate(webhook_urls):
+            # Prepare each webhook's POST once; every send reuses the same URL, headers, and body
+            try:
+                request = self.http.prepare_request(requests.Request('POST', webhook_url, data=body))
+            except requests.RequestException as e:
+                logger.error("Skipping invalid webhook URL %s: %s", webhook_url, e)
+                continue
+            future = self._pool.submit(self._webhook_loop, webhook_url, request, delay, shard_name, counts, index)
+            future.add_done_callback(self._log_worker_error)
+            self.futures[shard_name].append(future)
+        logger.info("Started shard: %s", shard_name)
 
     def _stop_shard(self, shard_name: str):
-        """Stop sending messages for a shard and join its threads before clearing."""
+        """Stop sending messages for a shard and wait for its webhook loops before clearing."""
         if not self.shard_status.get(shard_name, False):
             return
         self.shard_status[shard_name] = False
-        threads = self.threads.get(shard_name, [])
-        for thread in threads:
-            if thread.is_alive():
-                thread.join(timeout=5)
-        self.threads[shard_name] = []
-        logger.info(f"Stopped shard: {shard_name}")
+        futures = self.futures.get(shard_name, [])
+        for future in futures:
+            future.cancel()  # Drops loops that are still queued; running ones exit on the status flag
+        wait(futures, timeout=5)
+        self.futures.pop(shard_name, None)
+        logger.info("Stopped shard: %s", shard_name)
+
+    def _log_worker_error(self, future):
+        """Log an exception that escaped a webhook loop, since the pool would otherwise swallow it."""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Webhook loop crashed: %s", future.exception())
 
     def _start_action(self):
         """Handle the Start button action based on the selected mode."""
@@ -760,12 +1002,22 @@ class OblivionGUI:
         else:
             self._start_sequential_mode()
 
+    def _selected_shards(self):
+        """Return the checked shards and whether any of them is running, in a single pass."""
+        selected, running = [], False
+        for shard, var in self.shard_states.items():
+            if var.get():
+                selected.append(shard)
+                if self.shard_status.get(shard, False):
+                    running = True
+        return selected, running
+
     def _start_parallel_mode(self):
-        selected_shards = [shard for shard, var in self.shard_states.items() if var.get()]
+        selected_shards, running = self._selected_shards()
         if not selected_shards:
             messagebox.showerror("Error", "Select at least one shard")
             return
-        if any(self.shard_status.get(shard, False) for shard in selected_shards):
+        if running:
             messagebox.showwarning("Warning", "One or more selected shards are already running")
             return
         for shard in selected_shards:
@@ -782,33 +1034,35 @@ class OblivionGUI:
             messagebox.showerror("Error", "Select a starting shard")
             return
         self.current_switch_shard = shard_name
+        self._switch_event = threading.Event()
         self._start_shard(shard_name)
-        threading.Thread(target=self._monitor_sequential_mode, daemon=True).start()
+        threading.Thread(target=self._monitor_sequential_mode, args=(self._switch_event,), daemon=True).start()
         self._set_start_stop_state(False, True)
         self._set_switch_combo_state(False)
 
-    def _monitor_sequential_mode(self):
+    def _monitor_sequential_mode(self, switch_event: threading.Event):
         """Monitor the current shard in Sequential mode and switch to the next shard when the total pings are reached."""
-        shard_names = list(self.webhook_groups.keys())
-        while self.shard_status.get(self.current_switch_shard, False):
-            webhook_urls = self.webhook_groups[self.current_switch_shard]
-            total_messages = sum(self.message_counts.get(url, 0) for url in webhook_urls)
+        # Each Sequential run has its own event, so a monitor left over from a previous run exits
+        while switch_event is self._switch_event and self.shard_status.get(self.current_switch_shard, False):
+            switch_event.wait()
+            switch_event.clear()
+            if switch_event is not self._switch_event or not self.shard_status.get(self.current_switch_shard, False):
+                break
+            total_messages = self.shard_message_totals[self.current_switch_shard]
             if total_messages >= self.total_pings:
                 # Stop the current shard and switch to the next one in the list
                 if self.current_switch_shard is not None:
                     self._stop_shard(self.current_switch_shard)
-                current_idx = shard_names.index(self.current_switch_shard)
-                next_idx = (current_idx + 1) % len(shard_names)  # Loop back to the first shard if at the end
-                self.current_switch_shard = shard_names[next_idx]
+                current_idx = self._shard_index[self.current_switch_shard]
+                next_idx = (current_idx + 1) % len(self._shard_names)  # Loop back to the first shard if at the end
+                self.current_switch_shard = self._shard_names[next_idx]
                 self._start_shard(self.current_switch_shard)
-                logger.info(f"Switched to shard: {self.current_switch_shard}")
-            time.sleep(5)
+                logger.info("Switched to shard: %s", self.current_switch_shard)
 
     def _update_switch_status(self):
         """Update the status label in Sequential mode to show current shard and progress."""
         if self.current_switch_shard:
-            webhook_urls = self.webhook_groups[self.current_switch_shard]
-            total_messages = sum(self.message_counts.get(url, 0) for url in webhook_urls)
+            total_messages = self.shard_message_totals[self.current_switch_shard]
             self.switch_status_var.set(
                 f"Sequential Mode: {self.current_switch_shard} ({total_messages}/{self.total_pings} pings)"
             )
@@ -821,8 +1075,8 @@ class OblivionGUI:
             self._stop_sequential_mode()
 
     def _stop_parallel_mode(self):
-        selected_shards = [shard for shard, var in self.shard_states.items() if var.get()]
-        if not any(self.shard_status.get(shard, False) for shard in selected_shards):
+        selected_shards, running = self._selected_shards()
+        if not running:
             messagebox.showwarning("Warning", "No selected shards are running")
             return
         for shard in selected_shards:
@@ -838,10 +1092,19 @@ class OblivionGUI:
         if self.current_switch_shard is not None:
             self._stop_shard(self.current_switch_shard)
         self.current_switch_shard = None
+        self._switch_event.set()  # Let the monitor thread see that the run is over
         self.switch_status_var.set("Sequential Mode: Idle")
         self._set_start_stop_state(True, False)
         self._set_switch_combo_state(True)
 
+    def _on_close(self):
+        """Signal all shards to stop, release pooled connections, and close the window."""
+        for shard in self.shard_status:
+            self.shard_status[shard] = False
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.http.close()
+        self.root.destroy()
+
     def _kill_action(self):
         """Immediately destroy the window and kill the program."""
         try:
@@ -879,19 +1142,35 @@ class OblivionGUI:
                 self.log_text.config(bg='white', fg='black', insertbackground='black')
 
 class TextHandler(logging.Handler):
-    """Custom logging handler to display logs in the GUI's text widget."""
-    def __init__(self, text_widget):
+    """Custom logging handler that buffers logs and periodically flushes them into the GUI's text widget."""
+    def __init__(self, text_widget, interval_ms: int = 100, max_lines: int = 2000):
         super().__init__()
         self.text_widget = text_widget
+        self.interval_ms = interval_ms
+        # Ring buffer: deque.append is atomic, so worker threads never touch Tk directly,
+        # and during a log flood only the newest max_lines lines are kept
+        self._queue = collections.deque(maxlen=max_lines)
+        self.text_widget.after(interval_ms, self._flush_to_widget)
 
     def emit(self, record):
-        msg = self.format(record)
-        self.text_widget.configure(state='normal')
-        self.text_widget.insert(tk.END, msg + '\n')
-        self.text_widget.see(tk.END)
-        self.text_widget.configure(state='disabled')
+        self._queue.append(self.format(record) + '\n')
+
+    def _flush_to_widget(self):
+        """Insert everything buffered since the last tick in one go (runs on the Tk main thread)."""
+        lines = [self._queue.popleft() for _ in range(len(self._queue))]
+        if lines:
+            self.text_widget.configure(state='normal')
+            self.text_widget.insert(tk.END, ''.join(lines))
+            self.text_widget.see(tk.END)
+            self.text_widget.configure(state='disabled')
+        self.text_widget.after(self.interval_ms, self._flush_to_widget)
 
 if __name__ == "__main__":
+    # Webhook loops only wait on sockets, so give worker threads a small stack instead of the OS default
+    try:
+        threading.stack_size(WORKER_STACK_SIZE)
+    except (ValueError, RuntimeError) as e:
+        logger.warning("Could not set worker thread stack size: %s", e)
     # Entry point: create the main window and start the GUI application
     root = tk.Tk()
     app = OblivionGUI(root, resource_path("config.yaml"))